@@ -20,7 +20,7 @@ from .const import (
     KEY_DOOR_CONTACT_MAP, KEY_INPUT_STATE_CACHE, KEY_LAST_DOOR_STATUS,
     KEY_DOOR_CONTACT_STATE_CACHE, KEY_DOOR_HELD_OPEN_THRESHOLDS,
     KEY_UPDATE_PANELS_DEBOUNCER, UPDATE_PANELS_DEBOUNCE_SECONDS,
-    UPDATE_PANELS_PUSH_ATTEMPTS,
+    UPDATE_PANELS_PUSH_ATTEMPTS, KEY_LOADED_ENTRIES,
 )
 from .ws import SignalRClient
 from . import api
@@ -324,6 +324,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "_last_options_seen": dict(entry.options),
     }
     hass.data[DOMAIN][entry.entry_id] = data
+    hass.data[DOMAIN].setdefault(KEY_LOADED_ENTRIES, {})[entry.entry_id] = None
 
     # Coalesce PanelCommands/UpdateAll pushes. Multiple door mutations in
     # quick succession (the classic case: an automation locks a batch of
@@ -522,6 +523,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        hass.data[DOMAIN].get(KEY_LOADED_ENTRIES, {}).pop(entry.entry_id, None)
         hass.data[DOMAIN].pop(entry.entry_id, None)
         _LOGGER.debug("[%s] Entry data cleared", entry.entry_id)
     return unload_ok
@@ -16,6 +16,9 @@ from .const import (
     FRIENDLY_TO_TZ_INDEX,
     OVERRIDE_MODE_LABEL_TO_TOKEN,
     KEY_UPDATE_PANELS_DEBOUNCER,
+    KEY_DOORS_CACHE,
+    DOORS_CACHE_TTL_SECONDS,
+    OTR_BULK_DELETE_CONCURRENCY,
 )
 
 _LOGGER = logging.getLogger(f"{DOMAIN}.api")
@@ -194,6 +197,44 @@ async def get_all_doors(
         return []
 
 
+async def get_all_doors_cached(
+    hass,
+    entry_id: str,
+    ttl: float = DOORS_CACHE_TTL_SECONDS,
+) -> list[dict]:
+    """
+    Like get_all_doors(), but shares one fetch across callers for `ttl`
+    seconds. Used by the platform setups, which all need the door list at
+    the same moment. Concurrent callers await the in-flight fetch instead
+    of issuing their own. An empty or failed result is handed to the callers
+    already waiting on it but not kept, so the next caller fetches again.
+    """
+    import asyncio
+    import time
+
+    cfg = hass.data[DOMAIN][entry_id]
+    cache = cfg.setdefault(KEY_DOORS_CACHE, {"ts": 0.0, "task": None})
+
+    task = cache["task"]
+    if task is None or (task.done() and time.monotonic() - cache["ts"] >= ttl):
+
+        async def _fetch() -> list[dict]:
+            doors: list[dict] = []
+            try:
+                doors = await get_all_doors(hass, entry_id)
+                return doors
+            finally:
+                if doors:
+                    cache["ts"] = time.monotonic()
+                else:
+                    cache["task"] = None
+
+        task = cache["task"] = hass.async_create_task(_fetch())
+
+    # Shielded so one caller being cancelled doesn't cancel the others' fetch.
+    return await asyncio.shield(task)
+
+
 async def get_partition_name(hass, entry_id: str) -> str | None:
     """Look up the current Hartmann name for this entry's partition.
 
@@ -1753,12 +1794,16 @@ async def get_one_time_runs(
     hass,
     entry_id: str,
     door_id: Optional[int] = None,
+    door_ids: Optional[list[int]] = None,
 ) -> list[dict]:
     """
     Get list of OTR schedules.
     
     Args:
         door_id: Optional filter by door ID
+        door_ids: Optional filter by several door IDs (schedules touching any
+            of them are kept). Hartmann has no server-side door filter, so
+            this lets callers covering many doors fetch the list only once.
     
     Returns:
         List of schedule dicts with id, name, start_time, stop_time, door_name, mode, door_ids
@@ -1789,28 +1834,35 @@ async def get_one_time_runs(
         except Exception as map_err:
             _LOGGER.warning("%s: Could not build door name→ID map: %s", entry_id, map_err)
         
+        # Doors to filter for (empty = no filter). Entries with no resolvable
+        # door_ids fall back to matching by door name.
+        targets: set[int] = set(door_ids or ())
+        if door_id is not None:
+            targets.add(door_id)
+        target_names = {dn for dn, did in door_name_to_id.items() if did in targets}
+        
         schedules = []
         for r in results:
             # The list endpoint returns DoorName (string) per entry, NOT a Doors array.
             # Each OTR entry in Hartmann is per-door, so we resolve the ID from DoorName.
-            door_ids = []
+            sched_door_ids = []
             
             # Try DoorId field first (in case Hartmann adds it in the future)
             if r.get("DoorId"):
-                door_ids = [r.get("DoorId")]
+                sched_door_ids = [r.get("DoorId")]
             
             # Try Doors array (in case Hartmann adds it)
-            if not door_ids:
+            if not sched_door_ids:
                 doors_arr = r.get("Doors", [])
-                door_ids = [d.get("Id") for d in doors_arr if d.get("Id") is not None]
+                sched_door_ids = [d.get("Id") for d in doors_arr if d.get("Id") is not None]
             
             # Resolve DoorName to DoorId using our lookup
-            if not door_ids and r.get("DoorName") and r.get("DoorName") in door_name_to_id:
-                door_ids = [door_name_to_id[r["DoorName"]]]
+            if not sched_door_ids and r.get("DoorName") and r.get("DoorName") in door_name_to_id:
+                sched_door_ids = [door_name_to_id[r["DoorName"]]]
                 _LOGGER.debug("%s: Resolved DoorName '%s' -> DoorId %d for OTR %s",
-                             entry_id, r["DoorName"], door_ids[0], r.get("Id"))
+                             entry_id, r["DoorName"], sched_door_ids[0], r.get("Id"))
             
-            if not door_ids:
+            if not sched_door_ids:
                 _LOGGER.debug("%s: OTR %s has no resolvable door_ids (DoorName=%s)",
                              entry_id, r.get("Id"), r.get("DoorName"))
             
@@ -1824,28 +1876,21 @@ async def get_one_time_runs(
                 "site_name": r.get("SiteName"),
                 "mode": r.get("Mode"),
                 "partition_id": r.get("PartitionId"),
-                "door_ids": door_ids,
+                "door_ids": sched_door_ids,
             }
             
-            # Filter by door_id if provided
-            if door_id is not None:
-                if door_ids and door_id not in door_ids:
+            # Filter by door_id / door_ids if provided
+            if targets:
+                if sched_door_ids and targets.isdisjoint(sched_door_ids):
+                    continue
+                # If door_ids is empty, fall back to matching by door_name;
+                # skip unknown entries
+                if not sched_door_ids and r.get("DoorName") not in target_names:
                     continue
-                # If door_ids is empty, fall back to matching by door_name
-                if not door_ids:
-                    # Look up the name of the door we're filtering for
-                    target_door_name = None
-                    for dn, did in door_name_to_id.items():
-                        if did == door_id:
-                            target_door_name = dn
-                            break
-                    # Only include if door_name matches; skip unknown entries
-                    if not target_door_name or r.get("DoorName") != target_door_name:
-                        continue
             
             schedules.append(schedule)
         
-        _LOGGER.debug("%s: Found %d OneTimeRun schedules (filter door_id=%s)", entry_id, len(schedules), door_id)
+        _LOGGER.debug("%s: Found %d OneTimeRun schedules (filter door_ids=%s)", entry_id, len(schedules), sorted(targets))
         return schedules
         
     except Exception as e:
@@ -1895,6 +1940,56 @@ async def delete_one_time_run(
         return {"success": False, "error": f"Failed to delete schedule: {e}"}
 
 
+async def delete_one_time_runs_bulk(
+    hass,
+    entry_id: str,
+    schedule_ids: list[int],
+) -> dict:
+    """
+    Delete several OTR schedules in one go.
+    
+    Hartmann has no bulk-delete endpoint for OneTimeRunTimeZones, so the
+    per-ID DELETEs are issued concurrently instead of one after another.
+    The first one runs alone (so a stale session re-auths once, not per
+    request); the rest are capped at OTR_BULK_DELETE_CONCURRENCY in flight.
+    
+    Args:
+        schedule_ids: IDs of the schedules to delete
+    
+    Returns:
+        {"deleted": [ids...], "errors": {id: error_str}}
+    """
+    import asyncio
+
+    ids = list(dict.fromkeys(schedule_ids))
+    if not ids:
+        return {"deleted": [], "errors": {}}
+
+    sem = asyncio.Semaphore(OTR_BULK_DELETE_CONCURRENCY)
+
+    async def _delete(sid: int) -> dict:
+        async with sem:
+            return await delete_one_time_run(hass, entry_id, sid)
+
+    first = (await asyncio.gather(_delete(ids[0]), return_exceptions=True))[0]
+    rest = await asyncio.gather(
+        *(_delete(sid) for sid in ids[1:]),
+        return_exceptions=True,
+    )
+    results = [first, *rest]
+
+    deleted: list[int] = []
+    errors: dict[int, str] = {}
+    for sid, res in zip(ids, results):
+        if isinstance(res, BaseException):
+            errors[sid] = str(res)
+        elif res.get("success"):
+            deleted.append(sid)
+        else:
+            errors[sid] = str(res.get("error"))
+    return {"deleted": deleted, "errors": errors}
+
+
 
 # ============================================================================
 # Managed Door Schedules (HA-controlled DoorTimeZones)
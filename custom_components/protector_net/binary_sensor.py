@@ -120,7 +120,7 @@ async def async_setup_entry(
     base_url: str = cfg["base_url"]
 
     try:
-        doors = await api.get_all_doors(hass, entry.entry_id)
+        doors = await api.get_all_doors_cached(hass, entry.entry_id)
     except Exception as e:
         _LOGGER.error(
             "[%s] Failed to fetch doors for door-contact binary_sensors: %s",
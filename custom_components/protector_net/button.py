@@ -135,7 +135,7 @@ async def async_setup_entry(
         # Gather remote data with timeouts
         try:
             await asyncio.sleep(0.5)
-            doors = await asyncio.wait_for(api.get_all_doors(hass, entry.entry_id), timeout=30)
+            doors = await asyncio.wait_for(api.get_all_doors_cached(hass, entry.entry_id), timeout=30)
         except asyncio.TimeoutError:
             _LOGGER.error("[%s] get_all_doors timed out; no door buttons will be created right now", entry.entry_id)
             return
@@ -262,3 +262,39 @@ UPDATE_PANELS_DEBOUNCE_SECONDS = 2.5
 # coalesced single push against being the one that happens to fail.
 UPDATE_PANELS_PUSH_ATTEMPTS = 3
 
+
+# Domain-level data key (hass.data[DOMAIN][KEY_LOADED_ENTRIES]) holding the
+# entry_ids currently set up, as an insertion-ordered dict (values unused).
+# Lets services pick a fallback entry without scanning hass.data[DOMAIN] and
+# type-checking every value; the ordering keeps that fallback the earliest
+# loaded entry, as the old scan did, rather than a hash-order pick.
+KEY_LOADED_ENTRIES = "_entries"
+
+# Domain-level data keys for services' device_id -> (entry_id, door_id) memo.
+# Resolved lookups are kept across service calls so automations targeting the
+# same doors don't re-walk the device registry every time; the whole memo is
+# dropped on any device-registry update (KEY_DEVICE_DOOR_CACHE_UNSUB holds
+# that listener's unsubscribe callback). Failed lookups are never cached.
+KEY_DEVICE_DOOR_CACHE = "_device_door_cache"
+KEY_DEVICE_DOOR_CACHE_UNSUB = "_device_door_cache_unsub"
+
+# ---------------------------------------------------------------------------
+# Door list cache
+# ---------------------------------------------------------------------------
+# Per-entry data key holding a short-lived copy of the /api/doors result
+# as {"ts": monotonic_seconds, "task": asyncio.Task}. Every platform's
+# async_setup_entry needs the same door list and they all run concurrently
+# during entry setup; sharing one fetch saves a Hartmann round-trip per
+# platform. Callers arriving while the fetch is in flight, or within the TTL
+# after it finished, get that task's result (failure included).
+KEY_DOORS_CACHE = "doors_cache"
+
+# How long (seconds) a cached door list is served before re-fetching. Only
+# needs to span a single entry setup — renames and new doors are picked up by
+# the hourly name sync and the next reload regardless.
+DOORS_CACHE_TTL_SECONDS = 5.0
+
+# Max concurrent DELETEs when removing several OTR schedules at once. The
+# first DELETE always goes out alone so an expired session is re-authed once
+# instead of by every request in the batch.
+OTR_BULK_DELETE_CONCURRENCY = 4
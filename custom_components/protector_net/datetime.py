@@ -38,7 +38,7 @@ async def async_setup_entry(
     hass.data[DOMAIN][entry.entry_id].setdefault(UI_STATE, {})
 
     try:
-        doors = await api.get_all_doors(hass, entry.entry_id)
+        doors = await api.get_all_doors_cached(hass, entry.entry_id)
     except Exception as e:
         _LOGGER.error("[%s] Failed to fetch doors for datetime entities: %s", entry.entry_id, e)
         doors = []
@@ -43,7 +43,7 @@ async def async_setup_entry(
     hass.data[DOMAIN][entry.entry_id].setdefault(UI_STATE, {})
 
     try:
-        doors = await asyncio.wait_for(api.get_all_doors(hass, entry.entry_id), timeout=30)
+        doors = await asyncio.wait_for(api.get_all_doors_cached(hass, entry.entry_id), timeout=30)
     except Exception as e:
         _LOGGER.error("[%s] Failed to fetch doors for selects: %s", entry.entry_id, e)
         doors = []
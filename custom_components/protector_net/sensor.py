@@ -214,7 +214,7 @@ async def async_setup_entry(
         # ---- Primary filter: partition-scoped door IDs from API (same as WS client) ----
         allowed_door_ids: Optional[set[int]] = None
         try:
-            partition_doors = await api.get_all_doors(hass, entry.entry_id)
+            partition_doors = await api.get_all_doors_cached(hass, entry.entry_id)
             if partition_doors:
                 allowed_door_ids = {int(d["Id"]) for d in partition_doors if "Id" in d}
                 _LOGGER.debug(
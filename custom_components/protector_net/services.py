@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 import random
 import string
+from collections import defaultdict
 from datetime import datetime
 from typing import Any, Optional
 
@@ -18,8 +19,17 @@ import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-
-from .const import DOMAIN, UI_STATE, SCHEDULE_MODES
+from homeassistant.helpers.event import async_call_later
+
+from . import api, managed_schedules
+from .const import (
+    DOMAIN,
+    UI_STATE,
+    SCHEDULE_MODES,
+    KEY_LOADED_ENTRIES,
+    KEY_DEVICE_DOOR_CACHE,
+    KEY_DEVICE_DOOR_CACHE_UNSUB,
+)
 
 _LOGGER = logging.getLogger(f"{DOMAIN}.services")
 
@@ -192,6 +202,20 @@ SERVICE_SET_DOOR_SCHEDULE_MODE_SCHEMA = vol.Schema(
 # Valid override types
 OVERRIDE_TYPES = ["until_resumed", "for_time", "until_schedule"]
 
+# override_type -> (API token sent to apply_override, minutes required?)
+_OVERRIDE_SPEC = {
+    "until_resumed": ("Resume", False),
+    "for_time": ("Time", True),
+    "until_schedule": ("Schedule", False),
+}
+
+# override_type -> label used by the Override Type select entity
+_OVERRIDE_UI_LABEL = {
+    "until_resumed": "Until Resumed",
+    "for_time": "For Specified Time",
+    "until_schedule": "Until Next Schedule",
+}
+
 # Valid modes for override_door (same as OTR schedules)
 OVERRIDE_DOOR_MODES = [
     "Unlock",
@@ -243,10 +267,17 @@ def _get_door_id_from_device(hass: HomeAssistant, device_id: str) -> tuple[str |
     
     Device identifier format: (DOMAIN, "door:{host}:{door_id}|{entry_id}")
     
-    Returns (entry_id, door_id) or (None, None) if not found.
+    Returns (entry_id, door_id) or (None, None) if not found. Resolved
+    lookups are memoized in hass.data[DOMAIN][KEY_DEVICE_DOOR_CACHE] until
+    the next device-registry update.
     """
     from homeassistant.helpers import device_registry as dr
     
+    cache = hass.data.setdefault(DOMAIN, {}).setdefault(KEY_DEVICE_DOOR_CACHE, {})
+    cached = cache.get(device_id)
+    if cached is not None:
+        return cached
+    
     dev_reg = dr.async_get(hass)
     device = dev_reg.async_get(device_id)
     
@@ -271,6 +302,7 @@ def _get_door_id_from_device(hass: HomeAssistant, device_id: str) -> tuple[str |
                 # Door ID is after the last colon
                 door_id_str = host_and_door.rsplit(":", 1)[1]
                 door_id = int(door_id_str)
+                cache[device_id] = (entry_id, door_id)
                 return entry_id, door_id
             except (ValueError, IndexError) as e:
                 _LOGGER.debug("Failed to parse device identifier %s: %s", identifier, e)
@@ -335,6 +367,11 @@ def _get_door_id_from_entity(hass: HomeAssistant, entity_id: str) -> tuple[str |
         return None, None
 
 
+def _first_loaded_entry(hass: HomeAssistant) -> str | None:
+    """Return the earliest loaded entry_id (fallback when no door is given)."""
+    return next(iter(hass.data.get(DOMAIN, {}).get(KEY_LOADED_ENTRIES, ())), None)
+
+
 def _normalize_device_ids(device_ids: str | list[str]) -> list[str]:
     """Normalize device_ids to always be a list."""
     if isinstance(device_ids, str):
@@ -359,6 +396,10 @@ def _resolve_door_targets(
         doors_by_entry: {entry_id: [door_id, ...]}  — order preserved within
         invalid_entities: entity_ids that couldn't be resolved
         invalid_devices:  device_ids that couldn't be resolved
+
+    Targets whose config entry isn't currently loaded are reported as
+    invalid too, so callers never reach the API (and its exception path)
+    for an entry with no runtime data.
     """
     raw_entities = call.data.get("door_entity")
     raw_devices  = call.data.get("door_device_id")
@@ -367,42 +408,53 @@ def _resolve_door_targets(
     if raw_entities:
         entity_ids = (
             [raw_entities] if isinstance(raw_entities, str)
-            else list(raw_entities)
+            else list(dict.fromkeys(raw_entities))
         )
+    # De-dupe up front (order preserved) so each device's registry lookup
+    # runs once even when selectors overlap.
     device_ids: list[str] = (
-        _normalize_device_ids(raw_devices) if raw_devices else []
+        list(dict.fromkeys(_normalize_device_ids(raw_devices))) if raw_devices else []
     )
 
     seen: set[tuple[str, int]] = set()
-    doors_by_entry: dict[str, list[int]] = {}
+    doors_by_entry: dict[str, list[int]] = defaultdict(list)
     invalid_entities: list[str] = []
     invalid_devices:  list[str] = []
+    domain_data = hass.data.get(DOMAIN, {})
 
     for eid in entity_ids:
         entry_id, door_id = _get_door_id_from_entity(hass, eid)
-        if entry_id is None or door_id is None:
+        if entry_id is None or door_id is None or entry_id not in domain_data:
             invalid_entities.append(eid)
             continue
         key = (entry_id, int(door_id))
         if key in seen:
             continue
         seen.add(key)
-        doors_by_entry.setdefault(entry_id, []).append(int(door_id))
+        doors_by_entry[entry_id].append(int(door_id))
 
     for did in device_ids:
         entry_id, door_id = _get_door_id_from_device(hass, did)
-        if entry_id is None or door_id is None:
+        if entry_id is None or door_id is None or entry_id not in domain_data:
             invalid_devices.append(did)
             continue
         key = (entry_id, int(door_id))
         if key in seen:
             continue
         seen.add(key)
-        doors_by_entry.setdefault(entry_id, []).append(int(door_id))
+        doors_by_entry[entry_id].append(int(door_id))
 
     return doors_by_entry, invalid_entities, invalid_devices
 
 
+def _single_door_id(doors_by_entry: dict[str, list[int]]) -> int | None:
+    """Return the door_id if doors_by_entry targets exactly one door, else None."""
+    if len(doors_by_entry) != 1:
+        return None
+    door_ids = next(iter(doors_by_entry.values()))
+    return door_ids[0] if len(door_ids) == 1 else None
+
+
 def _find_doors_with_code_in_entry(
     hass: HomeAssistant,
     entry_id: str,
@@ -490,6 +542,20 @@ def _broadcast_update(
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up Hartmann Control Temp Code services."""
+    from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+    
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    
+    @callback
+    def _on_device_registry_updated(_event) -> None:
+        # Any add/remove/identifier change can re-point a device_id, so drop
+        # the whole memo rather than trying to patch single entries.
+        domain_data.pop(KEY_DEVICE_DOOR_CACHE, None)
+    
+    if KEY_DEVICE_DOOR_CACHE_UNSUB not in domain_data:
+        domain_data[KEY_DEVICE_DOOR_CACHE_UNSUB] = hass.bus.async_listen(
+            EVENT_DEVICE_REGISTRY_UPDATED, _on_device_registry_updated
+        )
     
     async def handle_create_temp_code(call: ServiceCall) -> dict[str, Any]:
         """Handle the create_temp_code service call.
@@ -500,7 +566,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         users, so the older "one user per door" model could only ever succeed
         for the first door of a multi-door bulk request.
         """
-        from . import api
         from .const import DEFAULT_PIN_DIGITS
         
         device_ids = _normalize_device_ids(call.data["door_device_id"])
@@ -701,7 +766,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         per entry and broadcasts the resulting cleanup to every sensor under
         that entry that was tracking the same PIN.
         """
-        from . import api
 
         device_ids = _normalize_device_ids(call.data["door_device_id"])
         code = call.data["code"]
@@ -770,7 +834,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     
     async def handle_delete_temp_code_by_name(call: ServiceCall) -> dict[str, Any]:
         """Handle the delete_temp_code_by_name service call - finds code by name from sensor."""
-        from . import api
 
         device_ids = _normalize_device_ids(call.data["door_device_id"])
         code_name = call.data["code_name"]
@@ -898,7 +961,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         also clears any sister-doors' sensors that were tracking the same
         PIN. We dedupe PINs per entry to avoid double-deleting the same user.
         """
-        from . import api
 
         device_ids = _normalize_device_ids(call.data["door_device_id"])
 
@@ -997,7 +1059,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         be reflected in every door's sensor so each one can reschedule its
         auto-expiration.
         """
-        from . import api
 
         device_ids = _normalize_device_ids(call.data["door_device_id"])
         code_name = call.data["code_name"]
@@ -1108,7 +1169,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         user to each door's APG. Each door's temp_code sensor receives a
         create event so it picks up the new entry.
         """
-        from . import api
 
         device_ids = _normalize_device_ids(call.data["door_device_id"])
         code = call.data.get("code")
@@ -1253,7 +1313,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         Each affected door's temp_code sensor receives a delete event for
         only its own entry; sister doors keep their entries.
         """
-        from . import api
 
         device_ids = _normalize_device_ids(call.data["door_device_id"])
         code = call.data.get("code")
@@ -1355,13 +1414,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     
     async def handle_update_panels(call: ServiceCall) -> dict[str, Any]:
         """Handle the update_panels service call - push config to all panels."""
-        from . import api
         
         # Use the first available entry_id
-        entry_id = next(iter(
-            eid for eid in hass.data.get(DOMAIN, {})
-            if isinstance(hass.data[DOMAIN][eid], dict) and "base_url" in hass.data[DOMAIN][eid]
-        ), None)
+        entry_id = _first_loaded_entry(hass)
         
         if not entry_id:
             return {"success": False, "error": "No Protector.Net integration found"}
@@ -1375,9 +1430,10 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     
     async def handle_create_otr_schedule(call: ServiceCall) -> dict[str, Any]:
         """Handle the create_otr_schedule service call."""
-        from . import api
         
-        device_ids = _normalize_device_ids(call.data["door_device_id"])
+        # De-dupe up front (order preserved) so overlapping selectors don't
+        # repeat registry lookups or send the same door twice.
+        device_ids = list(dict.fromkeys(_normalize_device_ids(call.data["door_device_id"])))
         start_time = call.data["start_time"]
         stop_time = call.data["stop_time"]
         mode = call.data.get("mode", "Unlock")
@@ -1385,7 +1441,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         description = call.data.get("description")
         
         # Group doors by entry_id - OTR creates one schedule with multiple doors
-        doors_by_entry: dict[str, list[int]] = {}
+        doors_by_entry: dict[str, list[int]] = defaultdict(list)
         
         for device_id in device_ids:
             entry_id, door_id = _get_door_id_from_device(hass, device_id)
@@ -1393,9 +1449,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 _LOGGER.warning("Could not determine door from device %s, skipping", device_id)
                 continue
             
-            if entry_id not in doors_by_entry:
-                doors_by_entry[entry_id] = []
-            doors_by_entry[entry_id].append(door_id)
+            # Two devices can still resolve to the same door
+            if door_id not in doors_by_entry[entry_id]:
+                doors_by_entry[entry_id].append(door_id)
         
         if not doors_by_entry:
             return {"success": False, "error": "No valid doors found"}
@@ -1403,6 +1459,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         # Create one schedule per Hartmann instance
         results = []
         all_success = True
+        refresh_entries: set[str] = set()
         
         for entry_id, door_ids in doors_by_entry.items():
             if entry_id not in hass.data.get(DOMAIN, {}):
@@ -1427,13 +1484,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     _LOGGER.info("Created OTR schedule for doors %s: %s to %s (%s)", 
                                 door_ids, start_time, stop_time, mode)
                     results.append(result)
-                    # Signal OTR sensors to refresh immediately (short delay for Hartmann to process)
-                    import asyncio
-                    await asyncio.sleep(1)
-                    async_dispatcher_send(
-                        hass,
-                        f"{DISPATCH_OTR}_{entry_id}",
-                    )
+                    refresh_entries.add(entry_id)
                 else:
                     _LOGGER.error("Failed to create OTR schedule: %s", result.get("error"))
                     results.append(result)
@@ -1444,6 +1495,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 results.append({"entry_id": entry_id, "door_ids": door_ids, "success": False, "error": str(e)})
                 all_success = False
         
+        # Signal OTR sensors to refresh, once per entry, after a short delay
+        # for Hartmann to process — without holding up the service response.
+        if refresh_entries:
+            @callback
+            def _refresh_otr_sensors(_now) -> None:
+                for eid in refresh_entries:
+                    async_dispatcher_send(hass, f"{DISPATCH_OTR}_{eid}")
+
+            async_call_later(hass, 1, _refresh_otr_sensors)
+        
         # Single entry/result backward compatibility
         if len(results) == 1:
             return results[0]
@@ -1454,69 +1515,74 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         """Handle the delete_otr_schedule service call.
         
         If schedule_id is provided, deletes that specific schedule.
-        If only door_device_id is provided, deletes ALL OTR schedules for that door.
+        If only door_device_id is provided, deletes ALL OTR schedules for the
+        selected door(s), using one schedule lookup per entry.
         """
-        from . import api
         
         schedule_id = call.data.get("schedule_id")
-        device_id = call.data.get("door_device_id")
+        raw_devices = call.data.get("door_device_id")
+        device_ids = list(dict.fromkeys(_normalize_device_ids(raw_devices))) if raw_devices else []
         
-        # Get entry_id and door_id from device
-        entry_id = None
-        door_id = None
-        if device_id:
+        # Get entry_id and door_id for each device, grouped per entry
+        doors_by_entry: dict[str, list[int]] = defaultdict(list)
+        for device_id in device_ids:
             entry_id, door_id = _get_door_id_from_device(hass, device_id)
+            if entry_id is None or door_id is None:
+                continue
+            if door_id not in doors_by_entry[entry_id]:
+                doors_by_entry[entry_id].append(door_id)
         
-        if entry_id is None:
-            # Try to find any available entry
-            domain_data = hass.data.get(DOMAIN, {})
-            for eid in domain_data:
-                if isinstance(domain_data[eid], dict) and "base_url" in domain_data[eid]:
-                    entry_id = eid
-                    break
-        
-        if entry_id is None:
-            _LOGGER.error("Could not determine integration entry")
-            return {"success": False, "error": "Integration not configured"}
-        
-        # Collect schedule IDs to delete
-        ids_to_delete = []
+        # Collect schedule IDs to delete, per entry
+        ids_by_entry: dict[str, list[int]] = {}
         
         if schedule_id is not None and schedule_id > 0:
             # Explicit ID given — delete just that one
-            ids_to_delete = [schedule_id]
-        elif door_id is not None:
-            # No valid schedule_id — find all schedules for this door and delete them
-            try:
-                schedules = await api.get_one_time_runs(hass, entry_id, door_id=door_id)
-                ids_to_delete = [s["id"] for s in schedules if s.get("id") is not None and s["id"] > 0]
-                _LOGGER.info("Found %d schedules to delete for door %d: %s", len(ids_to_delete), door_id, ids_to_delete)
-            except Exception as e:
-                _LOGGER.exception("Error finding schedules for door %d: %s", door_id, e)
-                return {"success": False, "error": f"Could not look up schedules: {e}"}
+            entry_id = next(iter(doors_by_entry), None) or _first_loaded_entry(hass)
+            if entry_id is None:
+                _LOGGER.error("Could not determine integration entry")
+                return {"success": False, "error": "Integration not configured"}
+            ids_by_entry[entry_id] = [schedule_id]
+        elif doors_by_entry:
+            # No valid schedule_id — find all schedules for these doors and
+            # delete them. One fetch per entry covers every selected door.
+            for entry_id, door_ids in doors_by_entry.items():
+                try:
+                    schedules = await api.get_one_time_runs(hass, entry_id, door_ids=door_ids)
+                except Exception as e:
+                    _LOGGER.exception("Error finding schedules for doors %s: %s", door_ids, e)
+                    return {"success": False, "error": f"Could not look up schedules: {e}"}
+                ids = list(dict.fromkeys(
+                    s["id"] for s in schedules if s.get("id") is not None and s["id"] > 0
+                ))
+                _LOGGER.info("Found %d schedules to delete for doors %s: %s", len(ids), door_ids, ids)
+                if ids:
+                    ids_by_entry[entry_id] = ids
+        elif _first_loaded_entry(hass) is None:
+            _LOGGER.error("Could not determine integration entry")
+            return {"success": False, "error": "Integration not configured"}
         else:
             return {"success": False, "error": "Provide either a schedule_id or a door_device_id"}
         
-        if not ids_to_delete:
+        if not ids_by_entry:
             return {"success": True, "message": "No schedules found to delete", "deleted": 0}
         
-        # Delete each schedule
         deleted = 0
-        errors = []
-        for sid in ids_to_delete:
+        errors: list[str] = []
+        for entry_id, ids_to_delete in ids_by_entry.items():
+            # Delete all of this entry's schedules in one batch
             try:
-                result = await api.delete_one_time_run(hass=hass, entry_id=entry_id, schedule_id=sid)
-                if result.get("success"):
-                    deleted += 1
-                    _LOGGER.info("Deleted OTR schedule ID %d", sid)
-                else:
-                    errors.append(f"ID {sid}: {result.get('error')}")
+                result = await api.delete_one_time_runs_bulk(hass, entry_id, ids_to_delete)
             except Exception as e:
-                errors.append(f"ID {sid}: {e}")
-        
-        # Signal OTR sensors to refresh
-        if deleted > 0:
-            async_dispatcher_send(hass, f"{DISPATCH_OTR}_{entry_id}")
+                _LOGGER.exception("Error deleting OTR schedules %s: %s", ids_to_delete, e)
+                errors.append(str(e))
+                continue
+            
+            deleted += len(result["deleted"])
+            errors.extend(f"ID {sid}: {err}" for sid, err in result["errors"].items())
+            
+            # Signal OTR sensors to refresh
+            if result["deleted"]:
+                async_dispatcher_send(hass, f"{DISPATCH_OTR}_{entry_id}")
         
         if errors:
             _LOGGER.error("Some schedule deletes failed: %s", errors)
@@ -1526,7 +1592,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     
     async def handle_get_otr_schedules(call: ServiceCall) -> dict[str, Any]:
         """Handle the get_otr_schedules service call."""
-        from . import api
         
         device_id = call.data.get("door_device_id")
         
@@ -1538,11 +1603,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         
         if entry_id is None:
             # Try to find any available entry
-            domain_data = hass.data.get(DOMAIN, {})
-            for eid in domain_data:
-                if isinstance(domain_data[eid], dict) and "base_url" in domain_data[eid]:
-                    entry_id = eid
-                    break
+            entry_id = _first_loaded_entry(hass)
         
         if entry_id is None:
             _LOGGER.error("Could not determine integration entry")
@@ -1555,7 +1616,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 door_id=door_id,
             )
             
-            _LOGGER.info("Retrieved OTR schedules", len(schedules))
+            _LOGGER.info("Retrieved %d OTR schedules", len(schedules))
             return {"success": True, "schedules": schedules}
             
         except Exception as e:
@@ -1568,7 +1629,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     
     async def handle_override_door(call: ServiceCall) -> dict[str, Any]:
         """Handle the override_door service call - apply override to doors."""
-        from . import api
         from homeassistant.util import dt as dt_util
         import math
         
@@ -1595,19 +1655,14 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             except (ValueError, TypeError) as e:
                 return {"success": False, "error": f"Invalid 'until' datetime: {until_raw} ({e})"}
         
-        # Map override_type to API token
-        type_map = {
-            "until_resumed": "Resume",
-            "for_time": "Time",
-            "until_schedule": "Schedule",
-        }
-        type_token = type_map.get(override_type, "Resume")
+        # Map override_type to API token + whether it takes minutes
+        type_token, needs_minutes = _OVERRIDE_SPEC.get(override_type, ("Resume", False))
         
         # Minutes only used for "for_time" type
-        minutes_arg = minutes if type_token == "Time" else None
+        minutes_arg = minutes if needs_minutes else None
         
         # Validate minutes required for timed override
-        if type_token == "Time" and not minutes_arg:
+        if needs_minutes and not minutes_arg:
             return {"success": False, "error": "minutes required for 'for_time' override type"}
         
         # Resolve targets from door_entity and/or door_device_id (legacy)
@@ -1640,19 +1695,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     results.append({"entry_id": entry_id, "door_ids": door_ids, "success": True})
                     
                     # Sync UI state so select entities reflect what was just set
-                    ui_type_map = {
-                        "until_resumed": "Until Resumed",
-                        "for_time": "For Specified Time",
-                        "until_schedule": "Until Next Schedule",
-                    }
-                    ui_type_label = ui_type_map.get(override_type, "For Specified Time")
-                    
-                    for did in door_ids:
-                        ui = hass.data.get(DOMAIN, {}).get(entry_id, {}).get(UI_STATE, {}).get(did)
-                        if ui is not None:
-                            ui["type"] = ui_type_label
-                            ui["mode_selected"] = mode
-                            ui["active"] = True
+                    # (no UI_STATE entries means no select/switch entities to sync)
+                    ui_map = hass.data.get(DOMAIN, {}).get(entry_id, {}).get(UI_STATE)
+                    if ui_map:
+                        ui_type_label = _OVERRIDE_UI_LABEL.get(override_type, "For Specified Time")
+                        for did in door_ids:
+                            ui = ui_map.get(did)
+                            if ui is not None:
+                                ui["type"] = ui_type_label
+                                ui["mode_selected"] = mode
+                                ui["active"] = True
                 else:
                     _LOGGER.error("Failed to apply override to doors %s", door_ids)
                     results.append({"entry_id": entry_id, "door_ids": door_ids, "success": False, "error": "Override failed"})
@@ -1664,10 +1716,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 all_success = False
         
         # Single-target backward compatibility (preserve flat shape when one door)
-        if (len(doors_by_entry) == 1 and
-            len(next(iter(doors_by_entry.values()))) == 1):
-            entry_id = next(iter(doors_by_entry))
-            door_id = doors_by_entry[entry_id][0]
+        door_id = _single_door_id(doors_by_entry)
+        if door_id is not None:
             return {
                 "success": all_success,
                 "door_id": door_id,
@@ -1691,7 +1741,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     
     async def handle_resume_door(call: ServiceCall) -> dict[str, Any]:
         """Handle the resume_door service call - resume normal schedule."""
-        from . import api
         
         # Resolve targets from door_entity and/or door_device_id (legacy)
         doors_by_entry, invalid_entities, invalid_devices = _resolve_door_targets(hass, call)
@@ -1716,11 +1765,13 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     results.append({"entry_id": entry_id, "door_ids": door_ids, "success": True})
                     
                     # Sync UI state
-                    for did in door_ids:
-                        ui = hass.data.get(DOMAIN, {}).get(entry_id, {}).get(UI_STATE, {}).get(did)
-                        if ui is not None:
-                            ui["active"] = False
-                            ui["mode_selected"] = "None"
+                    ui_map = hass.data.get(DOMAIN, {}).get(entry_id, {}).get(UI_STATE)
+                    if ui_map:
+                        for did in door_ids:
+                            ui = ui_map.get(did)
+                            if ui is not None:
+                                ui["active"] = False
+                                ui["mode_selected"] = "None"
                 else:
                     _LOGGER.error("Failed to resume schedule for doors %s", door_ids)
                     results.append({"entry_id": entry_id, "door_ids": door_ids, "success": False, "error": "Resume failed"})
@@ -1732,10 +1783,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 all_success = False
         
         # Single-target backward compatibility
-        if (len(doors_by_entry) == 1 and
-            len(next(iter(doors_by_entry.values()))) == 1):
-            entry_id = next(iter(doors_by_entry))
-            door_id = doors_by_entry[entry_id][0]
+        door_id = _single_door_id(doors_by_entry)
+        if door_id is not None:
             return {"success": all_success, "door_id": door_id}
         
         out: dict[str, Any] = {"success": all_success, "results": results}
@@ -1757,8 +1806,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         Refuses doors that aren't in the managed set; in that case the user
         should add them via integration reconfigure first.
         """
-        from . import api, managed_schedules
-
         # Entity-only — this service was introduced fresh in v0.2.5.
         raw_entities = call.data["door_entity"]
         entity_ids = (
@@ -1872,137 +1919,45 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         return {"success": all_success, "mode": mode, "results": results}
 
     # Register services with response support
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CREATE_TEMP_CODE,
-        handle_create_temp_code,
-        schema=SERVICE_CREATE_TEMP_CODE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DELETE_TEMP_CODE,
-        handle_delete_temp_code,
-        schema=SERVICE_DELETE_TEMP_CODE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DELETE_TEMP_CODE_BY_NAME,
-        handle_delete_temp_code_by_name,
-        schema=SERVICE_DELETE_TEMP_CODE_BY_NAME_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CLEAR_ALL_TEMP_CODES,
-        handle_clear_all_temp_codes,
-        schema=SERVICE_CLEAR_ALL_TEMP_CODES_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UPDATE_TEMP_CODE,
-        handle_update_temp_code,
-        schema=SERVICE_UPDATE_TEMP_CODE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ADD_DOOR_TO_TEMP_CODE,
-        handle_add_door_to_temp_code,
-        schema=SERVICE_DOOR_FOR_TEMP_CODE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REMOVE_DOOR_FROM_TEMP_CODE,
-        handle_remove_door_from_temp_code,
-        schema=SERVICE_DOOR_FOR_TEMP_CODE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UPDATE_PANELS,
-        handle_update_panels,
-        schema=vol.Schema({}),
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    # OTR Schedule services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CREATE_OTR_SCHEDULE,
-        handle_create_otr_schedule,
-        schema=SERVICE_CREATE_OTR_SCHEDULE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DELETE_OTR_SCHEDULE,
-        handle_delete_otr_schedule,
-        schema=SERVICE_DELETE_OTR_SCHEDULE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_GET_OTR_SCHEDULES,
-        handle_get_otr_schedules,
-        schema=SERVICE_GET_OTR_SCHEDULES_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    # Override / Resume door services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_OVERRIDE_DOOR,
-        handle_override_door,
-        schema=SERVICE_OVERRIDE_DOOR_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESUME_DOOR,
-        handle_resume_door,
-        schema=SERVICE_RESUME_DOOR_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_DOOR_SCHEDULE_MODE,
-        handle_set_door_schedule_mode,
-        schema=SERVICE_SET_DOOR_SCHEDULE_MODE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
+    # Every service this module registers: (name, handler, schema). Unload
+    # removes whatever is registered under DOMAIN, so it needs no mirror.
+    services = (
+        (SERVICE_CREATE_TEMP_CODE, handle_create_temp_code, SERVICE_CREATE_TEMP_CODE_SCHEMA),
+        (SERVICE_DELETE_TEMP_CODE, handle_delete_temp_code, SERVICE_DELETE_TEMP_CODE_SCHEMA),
+        (SERVICE_DELETE_TEMP_CODE_BY_NAME, handle_delete_temp_code_by_name, SERVICE_DELETE_TEMP_CODE_BY_NAME_SCHEMA),
+        (SERVICE_CLEAR_ALL_TEMP_CODES, handle_clear_all_temp_codes, SERVICE_CLEAR_ALL_TEMP_CODES_SCHEMA),
+        (SERVICE_UPDATE_TEMP_CODE, handle_update_temp_code, SERVICE_UPDATE_TEMP_CODE_SCHEMA),
+        (SERVICE_ADD_DOOR_TO_TEMP_CODE, handle_add_door_to_temp_code, SERVICE_DOOR_FOR_TEMP_CODE_SCHEMA),
+        (SERVICE_REMOVE_DOOR_FROM_TEMP_CODE, handle_remove_door_from_temp_code, SERVICE_DOOR_FOR_TEMP_CODE_SCHEMA),
+        (SERVICE_UPDATE_PANELS, handle_update_panels, vol.Schema({})),
+        # OTR Schedule services
+        (SERVICE_CREATE_OTR_SCHEDULE, handle_create_otr_schedule, SERVICE_CREATE_OTR_SCHEDULE_SCHEMA),
+        (SERVICE_DELETE_OTR_SCHEDULE, handle_delete_otr_schedule, SERVICE_DELETE_OTR_SCHEDULE_SCHEMA),
+        (SERVICE_GET_OTR_SCHEDULES, handle_get_otr_schedules, SERVICE_GET_OTR_SCHEDULES_SCHEMA),
+        # Override / Resume door services
+        (SERVICE_OVERRIDE_DOOR, handle_override_door, SERVICE_OVERRIDE_DOOR_SCHEMA),
+        (SERVICE_RESUME_DOOR, handle_resume_door, SERVICE_RESUME_DOOR_SCHEMA),
+        (SERVICE_SET_DOOR_SCHEDULE_MODE, handle_set_door_schedule_mode, SERVICE_SET_DOOR_SCHEDULE_MODE_SCHEMA),
     )
+    for service, handler, schema in services:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
 
     _LOGGER.info("Registered Hartmann Control services (temp codes + OTR schedules + override/resume + managed schedules)")
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload Hartmann Control services."""
-    hass.services.async_remove(DOMAIN, SERVICE_CREATE_TEMP_CODE)
-    hass.services.async_remove(DOMAIN, SERVICE_DELETE_TEMP_CODE)
-    hass.services.async_remove(DOMAIN, SERVICE_DELETE_TEMP_CODE_BY_NAME)
-    hass.services.async_remove(DOMAIN, SERVICE_CLEAR_ALL_TEMP_CODES)
-    hass.services.async_remove(DOMAIN, SERVICE_UPDATE_TEMP_CODE)
-    hass.services.async_remove(DOMAIN, SERVICE_UPDATE_PANELS)
-    hass.services.async_remove(DOMAIN, SERVICE_ADD_DOOR_TO_TEMP_CODE)
-    hass.services.async_remove(DOMAIN, SERVICE_REMOVE_DOOR_FROM_TEMP_CODE)
-    hass.services.async_remove(DOMAIN, SERVICE_CREATE_OTR_SCHEDULE)
-    hass.services.async_remove(DOMAIN, SERVICE_DELETE_OTR_SCHEDULE)
-    hass.services.async_remove(DOMAIN, SERVICE_GET_OTR_SCHEDULES)
-    hass.services.async_remove(DOMAIN, SERVICE_OVERRIDE_DOOR)
-    hass.services.async_remove(DOMAIN, SERVICE_RESUME_DOOR)
-    hass.services.async_remove(DOMAIN, SERVICE_SET_DOOR_SCHEDULE_MODE)
+    for service in list(hass.services.async_services().get(DOMAIN, {})):
+        hass.services.async_remove(DOMAIN, service)
+    domain_data = hass.data.get(DOMAIN, {})
+    unsub = domain_data.pop(KEY_DEVICE_DOOR_CACHE_UNSUB, None)
+    if unsub is not None:
+        unsub()
+    domain_data.pop(KEY_DEVICE_DOOR_CACHE, None)
     _LOGGER.info("Unregistered Hartmann Control services")
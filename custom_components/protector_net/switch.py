@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
+import time
 from datetime import datetime as dt_datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
@@ -35,6 +37,85 @@ _LOGGER = logging.getLogger(__name__)
 DISPATCH_DOOR = f"{DOMAIN}_door_event"
 DISPATCH_HUB = f"{DOMAIN}_hub_event"
 
+# Door list fetch attempts during setup before giving up on an empty result
+SWITCH_DOOR_FETCH_ATTEMPTS = 3
+
+def _payload_door_id(payload: Dict[str, Any]) -> Optional[int]:
+    """door_id of a door-status payload; producers send ints, so skip int() then."""
+    did = payload.get("door_id")
+    if did is None or type(did) is int:
+        return did
+    try:
+        return int(did)
+    except (TypeError, ValueError):
+        return None
+
+
+def _build_echo_status(overridden: bool, tz_idx: Optional[int]) -> Dict[str, Any]:
+    """Optimistic door-status payload, with timeZone only when it is known."""
+    if tz_idx is None:
+        return {"overridden": overridden}
+    return {"overridden": overridden, "timeZone": tz_idx}
+
+
+# All-doors Lockdown: tokens and optimistic echo statuses are constant, so
+# resolve them once. The status dicts are shared by every dispatch and must
+# be treated as read-only by subscribers.
+_LOCKDOWN_TYPE_TOKEN = OVERRIDE_TYPE_LABEL_TO_TOKEN.get("until resume") or OVERRIDE_TYPE_LABEL_TO_TOKEN.get("resume") or "Resume"
+_LOCKDOWN_MODE_TOKEN = OVERRIDE_MODE_LABEL_TO_TOKEN.get("lockdown") or "Lockdown"
+_LOCKDOWN_TZ_IDX = FRIENDLY_TO_TZ_INDEX.get("Lockdown")
+_LOCKDOWN_ON_STATUS: Dict[str, Any] = _build_echo_status(True, _LOCKDOWN_TZ_IDX)
+_RESUME_OFF_STATUS: Dict[str, Any] = {"overridden": False}
+
+# How long after an optimistic echo a WS status repeating it is treated as
+# the server confirming what we already applied (and dropped).
+ECHO_DEDUPE_SECONDS = 1.5
+
+# Status fields the switches act on. A frame carrying one of these that the
+# echo did not (e.g. the resumed door's real timeZone after a bare
+# {"overridden": False} echo) is new information and must not be dropped.
+_ECHO_TRACKED_FIELDS = ("overridden", "timeZone")
+
+
+def _matches_pending_echo(
+    pending: tuple[Dict[str, Any], float] | None, st: Dict[str, Any]
+) -> bool:
+    """True if `st` only repeats what a still-fresh optimistic echo applied."""
+    if pending is None:
+        return False
+    echoed, deadline = pending
+    if time.monotonic() >= deadline:
+        return False
+    if any(k in st and k not in echoed for k in _ECHO_TRACKED_FIELDS):
+        return False
+    return all(k in st and st[k] == v for k, v in echoed.items())
+
+
+@lru_cache(maxsize=64)
+def _resolve_override_tokens(
+    type_label: str, mode_label: str
+) -> tuple[Optional[str], Optional[str], Optional[int]]:
+    """Map UI labels to (type_token, mode_token, tz_idx); the tables are static."""
+    return (
+        OVERRIDE_TYPE_LABEL_TO_TOKEN.get(type_label.lower()),
+        OVERRIDE_MODE_LABEL_TO_TOKEN.get(mode_label.lower()),
+        FRIENDLY_TO_TZ_INDEX.get(mode_label),
+    )
+
+
+def _base_url_parts(entry_data: Dict[str, Any], base_url: str) -> tuple[str, str]:
+    """Return (netloc, host_safe) for base_url, parsed once per entry.
+
+    Every switch on an entry derives the same two strings; cache them on the
+    entry's runtime data so only the first entity pays for urlparse.
+    """
+    parts = entry_data.get("_base_url_parts")
+    if parts is None:
+        parsed = urlparse(base_url)
+        parts = (parsed.netloc or "", (parsed.hostname or "").replace(":", "_"))
+        entry_data["_base_url_parts"] = parts
+    return parts
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -47,12 +128,20 @@ async def async_setup_entry(
     hass.data[DOMAIN][entry.entry_id].setdefault(UI_STATE, {})
 
     # ----- Per-door override switches -----
-    try:
-        await asyncio.sleep(0.4)
-        doors = await api.get_all_doors(hass, entry.entry_id)
-    except Exception as e:
-        _LOGGER.error("[%s] Failed to fetch doors for override switches: %s", entry.entry_id, e)
-        doors = []
+    # No up-front delay: the door list is shared with the other platforms,
+    # so only back off (0.4s, 0.8s) when the server returned nothing. An
+    # empty result is never kept by get_all_doors_cached, so each retry
+    # issues (or joins) a fresh fetch rather than re-reading the failure.
+    doors: list[dict] = []
+    for attempt in range(SWITCH_DOOR_FETCH_ATTEMPTS):
+        try:
+            doors = await api.get_all_doors_cached(hass, entry.entry_id)
+        except Exception as e:
+            _LOGGER.error("[%s] Failed to fetch doors for override switches: %s", entry.entry_id, e)
+            doors = []
+        if doors or attempt == SWITCH_DOOR_FETCH_ATTEMPTS - 1:
+            break
+        await asyncio.sleep(0.4 * (2 ** attempt))
 
     entities: list[SwitchEntity] = [OverrideSwitch(hass, entry, d) for d in (doors or [])]
 
@@ -77,6 +166,25 @@ async def async_setup_entry(
 class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
     """Master 'Override' control for a door."""
 
+    # One of these per door. Entity itself keeps a __dict__ (HA's cached
+    # properties need it), so hass/_attr_* stay there; our own per-instance
+    # state lives in slots instead of adding keys to every instance dict.
+    __slots__ = (
+        "_entry",
+        "_entry_id",
+        "_door",
+        "_door_id",
+        "_door_name",
+        "_host_key",
+        "_hub_identifier",
+        "_ui",
+        "_is_on",
+        "_action_lock",
+        "_unsub_dispatch",
+        "_door_signal",
+        "_pending_echo",
+    )
+
     _attr_has_entity_name = True
     _attr_name = "Override"
     _attr_should_poll = False
@@ -92,13 +200,13 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
         self._door_name: str = door.get("Name") or f"Door {self._door_id}"
 
         entry_data = hass.data[DOMAIN][self._entry_id]
-        self._host_key: str = entry_data.get("host") or (urlparse(entry.data["base_url"]).netloc or "")
+        netloc, host_safe = _base_url_parts(entry_data, entry.data["base_url"])
+        self._host_key: str = entry_data.get("host") or netloc
         self._hub_identifier: str = entry_data.get("hub_identifier", f"hub:{self._host_key}|{self._entry_id}")
 
-        host_safe = (urlparse(entry.data["base_url"]).hostname or "").replace(":", "_")
         self._attr_unique_id = f"protector_net_{host_safe}_{self._entry_id}_{self._door_id}_override_switch"
 
-        self._ui = self.hass.data[DOMAIN][self._entry_id][UI_STATE].setdefault(
+        self._ui = entry_data[UI_STATE].setdefault(
             self._door_id,
             {
                 "type": DEFAULT_OVERRIDE_TYPE,
@@ -110,27 +218,29 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
         )
 
         self._is_on: bool = bool(self._ui.get("active"))
-        self._busy: bool = False
+        self._action_lock = asyncio.Lock()
         self._unsub_dispatch = None
+        self._door_signal = f"{DISPATCH_DOOR}_{self._entry_id}"
+        # (echoed status, monotonic deadline) of our last optimistic echo
+        self._pending_echo: tuple[Dict[str, Any], float] | None = None
 
-    @property
-    def is_on(self) -> bool:
-        return self._is_on
-
-    @property
-    def device_info(self):
-        return {
+        # Static for the entity's lifetime — build once
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, f"door:{self._host_key}:{self._door_id}|{self._entry_id}")},
             "name": self._door_name,
             "manufacturer": "Yoel Goldstein/Vaayer LLC",
             "model": "Protector.Net Door",
             "via_device": (DOMAIN, self._hub_identifier),
-            "configuration_url": self._entry.data.get("base_url"),
+            "configuration_url": entry.data.get("base_url"),
         }
 
+    @property
+    def is_on(self) -> bool:
+        return self._is_on
+
     async def async_added_to_hass(self) -> None:
         self._unsub_dispatch = async_dispatcher_connect(
-            self.hass, f"{DISPATCH_DOOR}_{self._entry_id}", self._on_door_status
+            self.hass, self._door_signal, self._on_door_status
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -142,11 +252,11 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
     # User interactions
     # ----------------------------
     async def async_turn_on(self, **kwargs) -> None:
-        if self._busy:
+        if self._action_lock.locked():
             return
-        self._busy = True
-        try:
-            mode_label: str = str(self._ui.get("mode_selected", DEFAULT_OVERRIDE_MODE))
+        async with self._action_lock:
+            ui = self._ui
+            mode_label: str = str(ui.get("mode_selected", DEFAULT_OVERRIDE_MODE))
             if mode_label == "None":
                 _LOGGER.warning(
                     "[%s] Door %s: Override ON requested while Mode=None; ignoring.",
@@ -155,11 +265,10 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
                 self._set_local_active(False)
                 return
 
-            type_label: str = str(self._ui.get("type", DEFAULT_OVERRIDE_TYPE))
-            minutes: int = int(self._ui.get("minutes", DEFAULT_OVERRIDE_MINUTES))
+            type_label: str = str(ui.get("type", DEFAULT_OVERRIDE_TYPE))
+            minutes: int = int(ui.get("minutes", DEFAULT_OVERRIDE_MINUTES))
 
-            type_token = OVERRIDE_TYPE_LABEL_TO_TOKEN.get(type_label.lower())
-            mode_token = OVERRIDE_MODE_LABEL_TO_TOKEN.get(mode_label.lower())
+            type_token, mode_token, tz_idx = _resolve_override_tokens(type_label, mode_label)
             if not type_token or not mode_token:
                 _LOGGER.error("[%s] Door %s: Invalid type/mode -> %r / %r", self._entry_id, self._door_id, type_label, mode_label)
                 self._set_local_active(False)
@@ -169,7 +278,7 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
             # When type is "For Specified Time", prefer the datetime picker
             # value over raw minutes (auto-compute the delta).
             if type_token == "Time":
-                override_until: dt_datetime | None = self._ui.get("override_until")
+                override_until: dt_datetime | None = ui.get("override_until")
                 if override_until is not None:
                     now = dt_util.now()
                     # Ensure both are tz-aware for comparison
@@ -205,21 +314,17 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
 
             # Optimistic ON + echo a local door-status so selects/sensors update instantly
             self._set_local_active(True)
-            tz_idx = FRIENDLY_TO_TZ_INDEX.get(mode_label)
             async_dispatcher_send(
                 self.hass,
-                f"{DISPATCH_DOOR}_{self._entry_id}",
-                {"door_id": self._door_id, "status": {"overridden": True, **({"timeZone": tz_idx} if tz_idx is not None else {})}},
+                self._door_signal,
+                {"door_id": self._door_id, "status": _build_echo_status(True, tz_idx)},
             )
-
-        finally:
-            self._busy = False
+            self._pending_echo = ({"overridden": True}, time.monotonic() + ECHO_DEDUPE_SECONDS)
 
     async def async_turn_off(self, **kwargs) -> None:
-        if self._busy:
+        if self._action_lock.locked():
             return
-        self._busy = True
-        try:
+        async with self._action_lock:
             ok = await api.resume_schedule(self.hass, self._entry_id, [self._door_id])
             if not ok:
                 _LOGGER.error("[%s] Door %s: resume_schedule failed", self._entry_id, self._door_id)
@@ -230,34 +335,39 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
             self._ui["mode_selected"] = "None"
             async_dispatcher_send(
                 self.hass,
-                f"{DISPATCH_DOOR}_{self._entry_id}",
+                self._door_signal,
                 {"door_id": self._door_id, "status": {"overridden": False}},
             )
-
-        finally:
-            self._busy = False
+            self._pending_echo = ({"overridden": False}, time.monotonic() + ECHO_DEDUPE_SECONDS)
 
     # ----------------------------
     # WS handling
     # ----------------------------
     @callback
     def _on_door_status(self, payload: Dict[str, Any]) -> None:
-        if int(payload.get("door_id", -1)) != self._door_id:
+        if _payload_door_id(payload) != self._door_id:
             return
 
         st = payload.get("status") or {}
-        changed = False
+        # The server confirming our own optimistic echo changes nothing here
+        # (the selects track reader_mode from the same frame themselves).
+        if _matches_pending_echo(self._pending_echo, st):
+            return
+        ui = self._ui
+        # Only is_on is visible on this entity; the shared UI dict updates
+        # (mode_selected / reader_mode) are read by the selects themselves
+        # and don't need a state write here.
+        visible_changed = False
 
         if "overridden" in st:
             new_active = bool(st["overridden"])
-            if self._ui.get("active") != new_active:
-                self._ui["active"] = new_active
-            if self._is_on != new_active:
+            if ui.get("active") is not new_active:
+                ui["active"] = new_active
+            if self._is_on is not new_active:
                 self._is_on = new_active
-                changed = True
-            if not new_active and self._ui.get("mode_selected") != "None":
-                self._ui["mode_selected"] = "None"
-                changed = True
+                visible_changed = True
+            if not new_active and ui.get("mode_selected") != "None":
+                ui["mode_selected"] = "None"
 
         tz_idx = st.get("timeZone", None)
         if tz_idx is not None:
@@ -267,20 +377,22 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
                 tz_idx = None
             if tz_idx is not None:
                 friendly = TZ_INDEX_TO_FRIENDLY.get(tz_idx)
-                if friendly and self._ui.get("reader_mode") != friendly:
-                    self._ui["reader_mode"] = friendly
-                    changed = True
+                if friendly and ui.get("reader_mode") != friendly:
+                    ui["reader_mode"] = friendly
 
-        if changed:
+        if visible_changed:
             self.async_write_ha_state()
 
     # ----------------------------
     # Helpers
     # ----------------------------
     def _set_local_active(self, active: bool) -> None:
-        if self._ui.get("active") != active:
-            self._ui["active"] = active
-        if self._is_on != active:
+        # Guarded on both sides so the optimistic echo and the real WS
+        # update that follows it collapse into a single state write.
+        ui = self._ui
+        if ui.get("active") is not active:
+            ui["active"] = active
+        if self._is_on is not active:
             self._is_on = active
             self.async_write_ha_state()
 
@@ -289,6 +401,17 @@ class OverrideSwitch(ProtectorNetDevice, SwitchEntity):
 # All Doors – Lockdown Mode switch  (new)
 # =====================================================================
 
+class _DoorRec:
+    """Last seen override/reader state of one door, for lockdown aggregation."""
+
+    __slots__ = ("active", "is_lockdown")
+
+    def __init__(self) -> None:
+        self.active: Optional[bool] = None
+        # Reader mode normalized on write: None until a mode has been seen
+        self.is_lockdown: Optional[bool] = None
+
+
 class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
     """
     Switch that applies 'Lockdown (Until Resume)' to ALL doors in this entry.
@@ -298,6 +421,23 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
       - is_on == True when EVERY mapped door is in Lockdown reader mode (by WS/sensors)
     """
 
+    __slots__ = (
+        "_entry",
+        "_entry_id",
+        "_host_key",
+        "_hub_identifier",
+        "_device_ident",
+        "_door_ids",
+        "_door_ids_set",
+        "_state_by_door",
+        "_is_on",
+        "_action_lock",
+        "_unsub_dispatch",
+        "_door_signal",
+        "_pending_echo",
+        "_host_full",
+    )
+
     _attr_should_poll = False
     _attr_has_entity_name = True
     _attr_name = "Lockdown Mode"
@@ -310,9 +450,11 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
 
         entry_data = hass.data[DOMAIN][self._entry_id]
         base_url = entry.data.get("base_url")
-        self._host_key: str = entry_data.get("host") or (urlparse(base_url).netloc if base_url else "")
+        netloc, host_safe = _base_url_parts(entry_data, base_url) if base_url else ("", "")
+        self._host_key: str = entry_data.get("host") or netloc
         self._hub_identifier: str = entry_data.get("hub_identifier", f"hub:{self._host_key}|{self._entry_id}")
-        host_safe = (urlparse(base_url).hostname or "").replace(":", "_") if base_url else self._host_key.replace(":", "_")
+        if not base_url:
+            host_safe = self._host_key.replace(":", "_")
 
         # Partition name for device label (try stored, else derive from title)
         partition_name = (
@@ -324,12 +466,15 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
         self._device_ident = f"alldoors:{self._host_key}|{self._entry_id}"
         self._attr_unique_id = f"protector_net_{host_safe}_{self._entry_id}_alldoors_lockdown_switch"
         self._door_ids: List[int] = [int(d["Id"]) for d in (doors or [])]
+        # Membership set for the per-dispatch "is this one of ours?" check;
+        # the ordered list above is kept for API calls and iteration.
+        self._door_ids_set: frozenset[int] = frozenset(self._door_ids)
 
         # Track current per-door reader/override status for quick aggregation
-        self._state_by_door: Dict[int, Dict[str, Any]] = {int(d["Id"]): {"active": None, "reader_mode": None} for d in (doors or [])}
+        self._state_by_door: Dict[int, _DoorRec] = {did: _DoorRec() for did in self._door_ids}
 
         # Exposed device info
-        self._device_info = {
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, self._device_ident)},
             "manufacturer": "Yoel Goldstein/Vaayer LLC",
             "model": "Protector.Net Partition",
@@ -339,20 +484,17 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
         }
 
         self._is_on = False
-        self._busy = False
+        self._action_lock = asyncio.Lock()
         self._unsub_dispatch = None
+        self._door_signal = f"{DISPATCH_DOOR}_{self._entry_id}"
+        # (echoed status, monotonic deadline) of the last all-doors echo
+        self._pending_echo: tuple[Dict[str, Any], float] | None = None
 
         # Quick boot seeding from sibling sensors (optional but makes it snappy)
         self._host_full: str = base_url.split("://", 1)[1] if base_url else self._host_key
 
-        self._seed_from_sensors_once()
-
     # ------------- HA properties -------------
 
-    @property
-    def device_info(self):
-        return dict(self._device_info)
-
     @property
     def is_on(self) -> bool:
         return self._is_on
@@ -361,8 +503,11 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
 
     async def async_added_to_hass(self) -> None:
         self._unsub_dispatch = async_dispatcher_connect(
-            self.hass, f"{DISPATCH_DOOR}_{self._entry_id}", self._on_door_status
+            self.hass, self._door_signal, self._on_door_status
         )
+        # Seed once we're registered: the subscription above is already live,
+        # and _recompute_and_push can write state now that we have an entity_id.
+        self._seed_from_sensors_once()
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub_dispatch:
@@ -372,76 +517,69 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
     # ------------- User actions -------------
 
     async def async_turn_on(self, **kwargs) -> None:
-        if self._busy:
+        if self._action_lock.locked():
             return
-        self._busy = True
-        try:
-            # Tokens
-            type_token = OVERRIDE_TYPE_LABEL_TO_TOKEN.get("until resume") or OVERRIDE_TYPE_LABEL_TO_TOKEN.get("resume") or "Resume"
-            mode_token = OVERRIDE_MODE_LABEL_TO_TOKEN.get("lockdown") or "Lockdown"
-
+        async with self._action_lock:
             ok = await api.apply_override(
                 self.hass,
                 self._entry_id,
                 self._door_ids,
-                override_type=type_token,
-                mode=mode_token,
+                override_type=_LOCKDOWN_TYPE_TOKEN,
+                mode=_LOCKDOWN_MODE_TOKEN,
                 minutes=None,
             )
             if not ok:
                 _LOGGER.error("[%s] AllDoors: apply_override Lockdown failed", self._entry_id)
                 return
 
-            # Optimistic echo for all doors
-            tz_idx = FRIENDLY_TO_TZ_INDEX.get("Lockdown")
-            for did in self._door_ids:
-                async_dispatcher_send(
-                    self.hass,
-                    f"{DISPATCH_DOOR}_{self._entry_id}",
-                    {"door_id": did, "status": {"overridden": True, **({"timeZone": tz_idx} if tz_idx is not None else {})}},
-                )
-
+            self._echo_all_doors(_LOCKDOWN_ON_STATUS)
             self._recompute_and_push()
 
-        finally:
-            self._busy = False
-
     async def async_turn_off(self, **kwargs) -> None:
-        if self._busy:
+        if self._action_lock.locked():
             return
-        self._busy = True
-        try:
+        async with self._action_lock:
             ok = await api.resume_schedule(self.hass, self._entry_id, self._door_ids)
             if not ok:
                 _LOGGER.error("[%s] AllDoors: resume_schedule failed", self._entry_id)
                 return
 
-            # Optimistic echo for all doors
-            for did in self._door_ids:
-                async_dispatcher_send(
-                    self.hass,
-                    f"{DISPATCH_DOOR}_{self._entry_id}",
-                    {"door_id": did, "status": {"overridden": False}},
-                )
-
+            self._echo_all_doors(_RESUME_OFF_STATUS)
             self._recompute_and_push()
 
-        finally:
-            self._busy = False
+    def _echo_all_doors(self, status: Dict[str, Any]) -> None:
+        """Optimistically dispatch `status` for every door of this entry.
+
+        Deliberately a plain loop: async_dispatcher_send runs @callback
+        subscribers inline, so the whole fan-out already completes within
+        this call. Wrapping it in asyncio.gather would only add one coroutine
+        per door; switch to gather if an echo ever needs to await something.
+        """
+        send = async_dispatcher_send
+        hass = self.hass
+        signal = self._door_signal
+        for did in self._door_ids:
+            send(hass, signal, {"door_id": did, "status": status})
+        # Armed after the fan-out so our own echo still lands in
+        # _state_by_door; only the server's repeat of it is dropped.
+        self._pending_echo = (status, time.monotonic() + ECHO_DEDUPE_SECONDS)
 
     # ------------- WS handling + state aggregation -------------
 
     @callback
     def _on_door_status(self, payload: Dict[str, Any]) -> None:
-        did = payload.get("door_id")
-        if did is None or int(did) not in self._door_ids:
+        did = _payload_door_id(payload)
+        if did is None or did not in self._door_ids_set:
             return
         st = payload.get("status") or {}
+        if _matches_pending_echo(self._pending_echo, st):
+            return
 
-        rec = self._state_by_door.setdefault(int(did), {"active": None, "reader_mode": None})
+        rec = self._state_by_door[did]
+        before_active, before_lockdown = rec.active, rec.is_lockdown
 
         if "overridden" in st:
-            rec["active"] = bool(st["overridden"])
+            rec.active = bool(st["overridden"])
 
         if "timeZone" in st:
             tz_idx = st.get("timeZone")
@@ -452,8 +590,12 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
             if tz_idx is not None:
                 friendly = TZ_INDEX_TO_FRIENDLY.get(tz_idx)
                 if friendly:
-                    rec["reader_mode"] = friendly
+                    rec.is_lockdown = friendly == "Lockdown"
 
+        # Frames carrying only unrelated fields (strike, door state, ...)
+        # can't move the aggregate.
+        if rec.active is before_active and rec.is_lockdown is before_lockdown:
+            return
         self._recompute_and_push()
 
     def _recompute_and_push(self) -> None:
@@ -461,19 +603,10 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
         if not self._door_ids:
             new_state = False
         else:
-            all_seen = True
-            all_lockdown = True
-            for did in self._door_ids:
-                rec = self._state_by_door.get(did) or {}
-                # We consider a door "lockdown" when its reader mode says Lockdown.
-                rm = (rec.get("reader_mode") or "").strip()
-                if not rm:
-                    all_seen = False
-                    all_lockdown = False
-                    break
-                if rm.lower() != "lockdown":
-                    all_lockdown = False
-            new_state = all_lockdown and all_seen
+            # A door counts as "lockdown" when its reader mode says Lockdown;
+            # the first unseen or non-lockdown door ends the scan. Every door
+            # has a record from __init__, so no separate "all seen" count.
+            new_state = all(rec.is_lockdown is True for rec in self._state_by_door.values())
 
         if self._is_on != new_state:
             self._is_on = new_state
@@ -487,14 +620,15 @@ class AllDoorsLockdownSwitch(ProtectorNetDevice, SwitchEntity):
         for did in self._door_ids:
             uid_over = f"{DOMAIN}_{self._host_full}_door_{did}_overridden|{self._entry_id}"
             uid_reader = f"{DOMAIN}_{self._host_full}_door_{did}_reader_mode|{self._entry_id}"
-            ent_over = next((e for e in reg.entities.values() if e.unique_id == uid_over), None)
-            ent_reader = next((e for e in reg.entities.values() if e.unique_id == uid_reader), None)
-            if ent_over:
-                st = self.hass.states.get(ent_over.entity_id)
+            # Indexed registry lookups (both are sensor-platform entities)
+            over_entity_id = reg.async_get_entity_id("sensor", DOMAIN, uid_over)
+            reader_entity_id = reg.async_get_entity_id("sensor", DOMAIN, uid_reader)
+            if over_entity_id:
+                st = self.hass.states.get(over_entity_id)
                 if st and st.state in ("On", "Off"):
-                    self._state_by_door[did]["active"] = (st.state == "On")
-            if ent_reader:
-                st = self.hass.states.get(ent_reader.entity_id)
+                    self._state_by_door[did].active = (st.state == "On")
+            if reader_entity_id:
+                st = self.hass.states.get(reader_entity_id)
                 if st and st.state:
-                    self._state_by_door[did]["reader_mode"] = st.state
+                    self._state_by_door[did].is_lockdown = st.state.strip().lower() == "lockdown"
         self._recompute_and_push()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+from functools import lru_cache
 import logging
 import re
 import ssl
@@ -14,6 +15,12 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
+# orjson ships with Home Assistant core; fall back to stdlib json if absent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from .const import (
         DOMAIN,
@@ -37,12 +44,124 @@ except Exception:
 
 _LOGGER = logging.getLogger(f"{DOMAIN}.ws")
 
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 SIGNALR_RS = "\x1e"  # record separator
+# Cap on a buffered, not-yet-terminated SignalR record (protects against a
+# peer that never sends the separator)
+RX_TAIL_MAX_CHARS = 1 << 20
 DISPATCH_DOOR = f"{DOMAIN}_door_event"        # sensors/switch/select listen on f"{...}_{entry_id}"
 DISPATCH_HUB  = f"{DOMAIN}_hub_event"
 DISPATCH_LOG  = f"{DOMAIN}_door_log"          # Last Door Log sensor
 DISPATCH_DOOR_CONTACT = f"{DOMAIN}_door_contact"   # Door open/closed binary_sensor
 
+# Hub sensor updates that only bump counters/last-seen fields are coalesced
+# into at most one dispatch per this many seconds.
+HUB_PUSH_INTERVAL = 0.25
+# Max remembered notification-text -> door lookups per door-map build; the
+# memo is simply emptied when it fills up.
+TEXT_DOOR_CACHE_MAX = 256
+
+# Door status fields surfaced in diagnostics and merged into the status cache
+_COMPACT_KEYS = ("strike", "opener", "overridden", "timeZone")
+
+# Name/message patterns used on every inbound frame — compiled once.
+_WS_RE = re.compile(r"\s+")
+_READER_SUFFIX_RE = re.compile(r"\s+reader(\s+\d+)?$")   # 'reader' or 'reader 2'
+_DOOR_SUFFIX_RE = re.compile(r"\s+(door|gate)$")          # 'door' or 'gate'
+_TOFOR_RE = re.compile(r"\b(?:to|on|for)\s+(.+)$", re.IGNORECASE)
+# Override line: "has been overridden" and "current state is <mode>" in
+# either order, in one match() from the start of the text (the lookahead
+# checks the first phrase without consuming). The mode group is optional so
+# a line without a readable mode still counts.
+_OVERRIDE_LINE_RE = re.compile(
+    r"(?=.*?has been overridden).*?current state is(?:\s+(?P<mode>[a-z\s/]+))?",
+    re.DOTALL,
+)
+# Override notification mode text → timeZone index. One alternation,
+# most specific first; _MODE_RANK keeps that precedence when the text
+# happens to mention more than one mode.
+_MODE_ALT = re.compile(
+    r"\b(?:(?P<cop>card\s+or\s+pin)|(?P<cap>card\s+and\s+pin)"
+    r"|(?P<fci>first\s+credential\s+in)|(?P<dual>dual\s+credential)"
+    r"|(?P<lock>lockdown)|(?P<unlock>unlock(?:ed)?)|(?P<pin>pin)|(?P<card>card))\b"
+)
+_MODE_TZ: Dict[str, int] = {
+    "cop": 3, "cap": 4, "fci": 6, "dual": 7,
+    "lock": 0, "unlock": 5, "pin": 2, "card": 1,
+}
+_MODE_RANK: Dict[str, int] = {name: i for i, name in enumerate(_MODE_TZ)}
+# The server normally names exactly one mode; try that before the regex.
+_MODE_EXACT: Dict[str, int] = {
+    "card or pin": 3,
+    "card and pin": 4,
+    "first credential in": 6,
+    "dual credential": 7,
+    "lockdown": 0,
+    "unlocked": 5,
+    "unlock": 5,
+    "pin": 2,
+    "card": 1,
+}
+
+
+def _mode_tz_from_text(mode_txt: str) -> Optional[int]:
+    """timeZone index named in an override message's mode text, if any."""
+    tz = _MODE_EXACT.get(mode_txt)
+    if tz is not None:
+        return tz
+    best: Optional[str] = None
+    for m in _MODE_ALT.finditer(mode_txt):
+        name = m.lastgroup
+        if best is None or _MODE_RANK[name] < _MODE_RANK[best]:
+            best = name
+    return _MODE_TZ[best] if best is not None else None
+
+
+# Notification phrases that synthesize a door status, by action. Dict order
+# is precedence (it mirrors the old elif chain); all phrases are matched in
+# a single pass over the lower-cased message.
+_SYNTH_PHRASES: Dict[str, Tuple[str, ...]] = {
+    "unlock": (
+        "unlock until resume",
+        "unlock until next schedule",
+        "timed override unlock",
+    ),
+    "card_or_pin": (
+        "cardorpin until resume",
+        "card or pin until resume",
+    ),
+    "resume": (
+        "resume schedule",
+        "schedule resumed",
+        "returned to schedule",
+        "override cleared",
+        "has resumed from an overridden state",
+    ),
+}
+_SYNTH_ACTION: Dict[str, str] = {
+    phrase: action for action, phrases in _SYNTH_PHRASES.items() for phrase in phrases
+}
+_SYNTH_RANK: Dict[str, int] = {action: i for i, action in enumerate(_SYNTH_PHRASES)}
+_SYNTH_RE = re.compile("|".join(re.escape(p) for p in _SYNTH_ACTION))
+
+
+def _synth_action_from_text(msg_l: str) -> Optional[str]:
+    """Highest-precedence synth action whose phrase occurs in `msg_l`."""
+    best: Optional[str] = None
+    for m in _SYNTH_RE.finditer(msg_l):
+        action = _SYNTH_ACTION[m.group(0)]
+        if best is None or _SYNTH_RANK[action] < _SYNTH_RANK[best]:
+            best = action
+    return best
+
 
 def _is_transient_outage(exc: BaseException) -> bool:
     """Return True if the exception looks like a server-down/restart event.
@@ -71,6 +190,32 @@ def _is_transient_outage(exc: BaseException) -> bool:
     return False
 
 
+# Door/reader names repeat across notifications, so both normalizers are
+# memoized (bounded: free-form message text passes through here too).
+@lru_cache(maxsize=4096)
+def _normalize_name(s: str) -> str:
+    return _WS_RE.sub(" ", (s or "").strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _strip_reader_suffix(s: str) -> str:
+    """Remove trailing 'reader', 'reader <num>', 'door', or 'gate'."""
+    s = _normalize_name(s)
+    s = _READER_SUFFIX_RE.sub("", s)
+    s = _DOOR_SUFFIX_RE.sub("", s)
+    return s.strip()
+
+
+def _reader_name_keys(rname: str) -> Tuple[str, ...]:
+    """_reader_by_name keys for a reader: its normalized name, plus the
+    door-ish base ("Kitchen Reader 2" → "kitchen") when that differs."""
+    norm = _normalize_name(rname)
+    base = _strip_reader_suffix(rname)
+    if base and base != norm:
+        return (norm, base)
+    return (norm,)
+
+
 def _mk_ssl_context(verify: bool) -> Optional[ssl.SSLContext]:
     """Return SSL context (None = default verify)."""
     if verify:
@@ -96,7 +241,16 @@ class SignalRClient:
         # Partition-scoped allowlist and maps
         self._allowed_door_ids: Set[int] = set()
         self._door_map: Dict[str, Tuple[int, str]] = {}
+        # Bumped whenever _door_map's contents change; keys _panels_cache
+        self._door_map_gen = 0
+        self._panels_cache: Tuple[int, List[str]] = (-1, [])
+        # statusId -> panel root for every door in the overview (ours or
+        # not), so frames for other partitions' doors skip the split
+        self._statusid_panel: Dict[str, str] = {}
         self._name_index: Dict[str, int] = {}
+        # _door_id_from_text results (misses included) for the current
+        # _name_index; reset whenever the door map is rebuilt.
+        self._text_door_cache: Dict[str, Optional[int]] = {}
         self._reader_by_id: dict[int, int] = {}
         self._reader_by_name: dict[str, int] = {}
         self._last_door_status_at: dict[int, float] = {}
@@ -105,6 +259,9 @@ class SignalRClient:
         # Actively managed handles
         self._session: ClientSession | None = None
         self._ws: Any | None = None
+        # Trailing SignalR record of the last TEXT message that had no
+        # separator yet; completed by the next message
+        self._rx_tail = ""
 
         # Hub status attrs
         self.phase = "idle"
@@ -116,7 +273,7 @@ class SignalRClient:
         # connection info
         self.ws_url: str | None = None
         self.connection_token: str | None = None
-        self._subscribed_panels: List[str] = []
+        self._subscribed_panels: frozenset[str] = frozenset()
 
         # counters / last seen
         self.door_events_seen = 0
@@ -126,6 +283,10 @@ class SignalRClient:
         self.last_door_payload: Dict[str, Any] | None = None
         self.last_log_line: str | None = None
 
+        # Hub push coalescing: pending flush + (phase, connected) last sent
+        self._hub_flush_handle: asyncio.TimerHandle | None = None
+        self._hub_pushed_phase: Tuple[str, bool] | None = None
+
         # --- Odyssey capability detection + sync task handle ---
         self._supports_status_snapshot: Optional[bool] = None
         self._sync_task: Optional[asyncio.Task] = None
@@ -210,10 +371,32 @@ class SignalRClient:
         self._ws = None
         self._session = None
 
+        # The runner's final "stopped" push already flushed; drop any
+        # coalesced update still pending so nothing fires after unload.
+        if self._hub_flush_handle is not None:
+            self._hub_flush_handle.cancel()
+            self._hub_flush_handle = None
+
     # Hub sensor helpers ------------------------------------------------------
 
     @callback
     def _push_hub_state(self) -> None:
+        """Publish hub attrs; phase/connection changes go out immediately,
+        counter-only updates during a frame burst are coalesced."""
+        if (self.phase, self.connected) != self._hub_pushed_phase:
+            self._flush_hub_state()
+            return
+        if self._hub_flush_handle is None:
+            self._hub_flush_handle = self.hass.loop.call_later(
+                HUB_PUSH_INTERVAL, self._flush_hub_state
+            )
+
+    @callback
+    def _flush_hub_state(self) -> None:
+        if self._hub_flush_handle is not None:
+            self._hub_flush_handle.cancel()
+            self._hub_flush_handle = None
+        self._hub_pushed_phase = (self.phase, self.connected)
         data = {
             "phase": self.phase,
             "connected": self.connected,
@@ -237,16 +420,6 @@ class SignalRClient:
 
     # Internals ---------------------------------------------------------------
 
-    def _normalize_name(self, s: str) -> str:
-        return re.sub(r"\s+", " ", (s or "").strip().lower())
-
-    def _strip_reader_suffix(self, s: str) -> str:
-        """Remove trailing 'reader', 'reader <num>', 'door', or 'gate'."""
-        s = self._normalize_name(s)
-        s = re.sub(r"\s+reader(\s+\d+)?$", "", s)  # 'reader' or 'reader 2'
-        s = re.sub(r"\s+(door|gate)$", "", s)      # 'door' or 'gate'
-        return s.strip()
-
     def _recent_real_status(self, door_id: int, window: float = 1.0) -> bool:
         """True if a real door status frame arrived within <window> seconds."""
         ts = self._last_door_status_at.get(door_id)
@@ -285,56 +458,70 @@ class SignalRClient:
                     "[%s] Failed to fetch system overview (will retry) [%s]: %s",
                     self.entry_id, type(e).__name__, e,
                 )
+            if self._door_map:
+                self._door_map_gen += 1
             self._door_map = {}
             self._reader_by_id = {}
             self._reader_by_name = {}
             self._name_index = {}
+            self._text_door_cache = {}
             return
 
         door_map: Dict[str, Tuple[int, str]] = {}
+        statusid_panel: Dict[str, str] = {}
         reader_by_id: dict[int, int] = {}
         reader_by_name: dict[str, int] = {}
         name_index: dict[str, int] = {}
 
-        def walk(node: Dict[str, Any], current_door: Optional[Tuple[int, str]] = None) -> None:
-            for sub in node.get("Nodes", []) or []:
-                ntype = sub.get("Type")
-                if ntype == "Door":
-                    sid = sub.get("StatusId")
-                    did = sub.get("Id")
-                    name = sub.get("Name")
-                    if isinstance(did, int) and did in self._allowed_door_ids:
-                        if sid:
-                            door_map[str(sid)] = (int(did), str(name))
-                        if name:
-                            name_index[self._normalize_name(str(name))] = int(did)
-                        walk(sub, (int(did), str(name)))
-                    else:
-                        # Skip doors not in our partition
-                        walk(sub, None)
-
-                elif ntype == "Reader" and current_door:
-                    rid = sub.get("Id")
-                    rname_raw = (sub.get("Name") or "").strip()
-                    if isinstance(rid, int):
-                        reader_by_id[int(rid)] = current_door[0]
-                    if rname_raw:
-                        reader_by_name[rname_raw.lower()] = current_door[0]
-                        base = self._strip_reader_suffix(rname_raw)
-                        if base and base != rname_raw.lower():
-                            reader_by_name[base] = current_door[0]
-                    walk(sub, current_door)
-                else:
-                    walk(sub, current_door)
-
+        # Iterative pre-order walk of the overview tree. Each stack entry is
+        # (node, door it sits under); children are pushed in reverse so they
+        # are visited in document order, exactly like the old recursion.
+        allowed = self._allowed_door_ids
         root = (ov or {}).get("Status", {})
-        for site in root.get("Nodes", []) or []:
-            walk(site, None)
-
+        stack: List[Tuple[Dict[str, Any], Optional[Tuple[int, str]]]] = []
+        for site in reversed(root.get("Nodes", []) or []):
+            for sub in reversed(site.get("Nodes", []) or []):
+                stack.append((sub, None))
+
+        while stack:
+            sub, current_door = stack.pop()
+            ntype = sub.get("Type")
+            if ntype == "Door":
+                sid = sub.get("StatusId")
+                did = sub.get("Id")
+                name = sub.get("Name")
+                if sid:
+                    statusid_panel[str(sid)] = str(sid).partition("::")[0]
+                if isinstance(did, int) and did in allowed:
+                    if sid:
+                        door_map[str(sid)] = (int(did), str(name))
+                    if name:
+                        name_index[_normalize_name(str(name))] = int(did)
+                    current_door = (int(did), str(name))
+                else:
+                    # Skip doors not in our partition
+                    current_door = None
+
+            elif ntype == "Reader" and current_door:
+                rid = sub.get("Id")
+                rname_raw = (sub.get("Name") or "").strip()
+                if isinstance(rid, int):
+                    reader_by_id[int(rid)] = current_door[0]
+                if rname_raw:
+                    for key in _reader_name_keys(rname_raw):
+                        reader_by_name[key] = current_door[0]
+
+            for child in reversed(sub.get("Nodes", []) or []):
+                stack.append((child, current_door))
+
+        if door_map != self._door_map:
+            self._door_map_gen += 1
         self._door_map = door_map
+        self._statusid_panel = statusid_panel
         self._reader_by_id = reader_by_id
         self._reader_by_name = reader_by_name
         self._name_index = name_index
+        self._text_door_cache = {}
 
         # ---- extra: pull explicit partition readers and merge ----
         try:
@@ -364,11 +551,8 @@ class SignalRClient:
 
                 # 2) reader-name -> door-id (plus "Kitchen Reader" → "Kitchen")
                 if rname:
-                    norm = rname.lower()
-                    self._reader_by_name[norm] = door_id_from_api
-                    base = self._strip_reader_suffix(rname)
-                    if base and base != norm:
-                        self._reader_by_name[base] = door_id_from_api
+                    for key in _reader_name_keys(rname):
+                        self._reader_by_name[key] = door_id_from_api
 
                 merged += 1
 
@@ -387,12 +571,18 @@ class SignalRClient:
             _LOGGER.debug("[%s] Map sample: %s", self.entry_id, sample)
 
     def _panels_from_map(self) -> List[str]:
+        """Sorted panel roots of the mapped doors (cached per door-map build)."""
+        gen, panels = self._panels_cache
+        if gen == self._door_map_gen:
+            return panels
         ctrls: set[str] = set()
-        for sid in self._door_map.keys():
-            root = str(sid).split("::", 1)[0]
+        for sid in self._door_map:
+            root = sid.partition("::")[0]
             if root:
                 ctrls.add(root)
-        return sorted(ctrls)
+        panels = sorted(ctrls)
+        self._panels_cache = (self._door_map_gen, panels)
+        return panels
 
     async def _negotiate(self, session: ClientSession, base: str, cookie: str) -> tuple[str, str]:
         """Negotiate a SignalR connection token; re-auth on 401.
@@ -428,7 +618,7 @@ class SignalRClient:
             "invocationId": inv_id,
             "streamIds": [],
         }
-        await ws.send_str(json.dumps(frame) + SIGNALR_RS)
+        await ws.send_str(_json_dumps(frame) + SIGNALR_RS)
 
     # ---------- Held-open synthesis (Protector.Net workaround) ----------
 
@@ -553,12 +743,24 @@ class SignalRClient:
     # ---------- Notification/Name helpers ----------
 
     def _door_id_from_text(self, txt: str) -> Optional[int]:
-        norm = self._normalize_name(txt)
+        # Notifications for unmapped doors (other partitions) repeat the same
+        # text, and each miss costs a full substring scan of _name_index.
+        cache = self._text_door_cache
+        if txt in cache:
+            return cache[txt]
+        did = self._match_door_text(txt)
+        if len(cache) >= TEXT_DOOR_CACHE_MAX:
+            cache.clear()
+        cache[txt] = did
+        return did
+
+    def _match_door_text(self, txt: str) -> Optional[int]:
+        norm = _normalize_name(txt)
         if not norm:
             return None
 
         variants = {norm}
-        stripped = self._strip_reader_suffix(norm)
+        stripped = _strip_reader_suffix(norm)
         if stripped:
             variants.add(stripped)
 
@@ -575,24 +777,29 @@ class SignalRClient:
         return None
 
     def _door_id_from_notification(self, note: Dict[str, Any]) -> Optional[int]:
-        src_type = (note.get("SourceType") or "").strip()
-        src_name = (note.get("SourceName") or "").strip()
+        src_type = (note.get("SourceType") or "").strip().lower()
         src_id = note.get("SourceId")
-        msg = (note.get("Message") or "").strip()
 
-        # If the source itself is a Door, SourceId is already the door id
-        if src_type.lower() == "door" and isinstance(src_id, int):
-            return int(src_id)
+        # Fast path: integer SourceId resolves without any string work.
+        if isinstance(src_id, int):
+            # If the source itself is a Door, SourceId is already the door id
+            if src_type == "door":
+                return int(src_id)
+            if src_type == "reader":
+                did = self._reader_by_id.get(src_id)
+                if did is not None:
+                    return did
+
+        src_name = (note.get("SourceName") or "").strip()
+        msg = (note.get("Message") or "").strip()
 
         # Reader sources
-        if src_type.lower() == "reader":
-            if isinstance(src_id, int) and src_id in self._reader_by_id:
-                return self._reader_by_id[int(src_id)]
+        if src_type == "reader":
             if src_name:
-                rid = self._reader_by_name.get(src_name.lower())
+                rid = self._reader_by_name.get(_normalize_name(src_name))
                 if rid is not None:
                     return rid
-                base = self._strip_reader_suffix(src_name)
+                base = _strip_reader_suffix(src_name)
                 if base:
                     rid = self._reader_by_name.get(base)
                     if rid is not None:
@@ -608,7 +815,7 @@ class SignalRClient:
                 return did
 
         # Fallback phrasing "... to/on/for <Door Name>"
-        m = re.search(r"\b(?:to|on|for)\s+(.+)$", msg, flags=re.IGNORECASE)
+        m = _TOFOR_RE.search(msg)
         if m:
             did = self._door_id_from_text(m.group(1))
             if did is not None:
@@ -816,6 +1023,7 @@ class SignalRClient:
                             heartbeat=30,
                         ) as ws:
                             self._ws = ws
+                            self._rx_tail = ""
                             backoff = base_backoff
 
                             self.connected = True
@@ -824,11 +1032,11 @@ class SignalRClient:
                             self._push_hub_state()
 
                             # SignalR handshake
-                            await ws.send_str(json.dumps({"protocol": "json", "version": 1}) + SIGNALR_RS)
+                            await ws.send_str(_json_dumps({"protocol": "json", "version": 1}) + SIGNALR_RS)
 
                             # Subscribe to panels
                             ctrls = self._panels_from_map()
-                            self._subscribed_panels = ctrls[:]
+                            self._subscribed_panels = frozenset(ctrls)
                             try:
                                 await self._send_invocation(ws, "Init", [None, None], "1")
                                 if ctrls:
@@ -851,17 +1059,25 @@ class SignalRClient:
                                     self._sync_task.cancel()
                                 self._sync_task = self.hass.async_create_task(self._periodic_sync_loop())
 
+                            # Per-frame loop: bind hot lookups once
+                            stop_is_set = self._stop.is_set
+                            handle_text = self._handle_text
+                            push_hub = self._push_hub_state
+                            msg_text = WSMsgType.TEXT
+                            msg_binary = WSMsgType.BINARY
+                            msg_closing = (WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.ERROR)
                             async for msg in ws:
-                                if self._stop.is_set():
+                                if stop_is_set():
                                     break
 
-                                if msg.type == WSMsgType.TEXT:
-                                    await self._handle_text(msg.data)
-                                elif msg.type == WSMsgType.BINARY:
+                                mtype = msg.type
+                                if mtype == msg_text:
+                                    await handle_text(msg.data)
+                                elif mtype == msg_binary:
                                     self.non_door_events_seen += 1
-                                    self._push_hub_state()
-                                elif msg.type in (WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.ERROR):
-                                    raise ClientError(f"WS closed: {msg.type}")
+                                    push_hub()
+                                elif mtype in msg_closing:
+                                    raise ClientError(f"WS closed: {mtype}")
 
                     except asyncio.CancelledError:
                         break
@@ -926,12 +1142,35 @@ class SignalRClient:
             self._sync_task = None
             self._push_hub_state()
 
+    def _iter_records(self, payload: str):
+        """Yield complete SignalR records from `payload`, scanning for the
+        separator in place instead of splitting into a list. An unterminated
+        trailing record is kept in _rx_tail and completed by the next message.
+        """
+        buf = self._rx_tail + payload if self._rx_tail else payload
+        self._rx_tail = ""
+        start = 0
+        while (idx := buf.find(SIGNALR_RS, start)) != -1:
+            if idx > start:
+                yield buf[start:idx]
+            start = idx + 1
+        if start < len(buf):
+            tail = buf[start:]
+            if len(tail) > RX_TAIL_MAX_CHARS:
+                _LOGGER.debug("[%s] Dropping unterminated %d-char record", self.entry_id, len(tail))
+            else:
+                self._rx_tail = tail
+
     async def _handle_text(self, payload: str) -> None:
         """Process inbound frames."""
-        frames = [f for f in payload.split(SIGNALR_RS) if f]
-        for frame in frames:
+        for frame in self._iter_records(payload):
+            # Only invocations (type 1) are handled. Pings (type 6),
+            # completions, close frames and the "{}" handshake ack are dropped
+            # unparsed; anything not in this compact shape is parsed as before.
+            if frame == "{}" or (frame.startswith('{"type":') and not frame.startswith('{"type":1')):
+                continue
             try:
-                data = json.loads(frame)
+                data = _json_loads(frame)
             except Exception:
                 self.last_log_line = f"Bad JSON frame (len={len(frame)})"
                 _LOGGER.debug("[%s] Bad JSON frame: %s", self.entry_id, frame[:200])
@@ -964,18 +1203,21 @@ class SignalRClient:
                         except ValueError:
                             pass
 
-                    compact = {k: st.get(k) for k in ("strike", "opener", "overridden", "timeZone")}
-                    self.last_door_payload = compact
-
-                    door = self._door_map.get(str(sid))
+                    sid_s = str(sid)
+                    door = self._door_map.get(sid_s)
                     if not door:
                         # Likely a door on the same panel but outside our partition; keep quiet.
-                        root = str(sid).split("::", 1)[0] if sid else ""
+                        root = ""
+                        if sid:
+                            root = self._statusid_panel.get(sid_s)
+                            if root is None:
+                                root = sid_s.partition("::")[0]
                         if root and (root in self._subscribed_panels):
-                            _LOGGER.debug(
-                                "[%s] Door frame for other door on subscribed panel (ignored): statusId=%s payload=%s",
-                                self.entry_id, sid, compact
-                            )
+                            if _LOGGER.isEnabledFor(logging.DEBUG):
+                                _LOGGER.debug(
+                                    "[%s] Door frame for other door on subscribed panel (ignored): statusId=%s payload=%s",
+                                    self.entry_id, sid, {k: st.get(k) for k in _COMPACT_KEYS}
+                                )
                             continue
                         # Otherwise, map might actually be stale -> refresh once
                         await self._build_door_map()
@@ -984,12 +1226,16 @@ class SignalRClient:
                     door_id, door_name = door
                     # Double guard (should not happen due to filtered map)
                     if self._allowed_door_ids and door_id not in self._allowed_door_ids:
-                        _LOGGER.debug(
-                            "[%s] Door frame for other partition (ignored): door_id=%s payload=%s",
-                            self.entry_id, door_id, compact
-                        )
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug(
+                                "[%s] Door frame for other partition (ignored): door_id=%s payload=%s",
+                                self.entry_id, door_id, {k: st.get(k) for k in _COMPACT_KEYS}
+                            )
                         continue
 
+                    compact = {k: st.get(k) for k in _COMPACT_KEYS}
+                    self.last_door_payload = compact
+
                     # remember: real status just arrived for this door
                     self._last_door_status_at[door_id] = self.hass.loop.time()
 
@@ -1031,7 +1277,7 @@ class SignalRClient:
                         if isinstance(cache, dict):
                             prev = cache.get(door_id, {})
                             merged = dict(prev)
-                            for k in ("strike", "opener", "overridden", "timeZone"):
+                            for k in _COMPACT_KEYS:
                                 v = st.get(k)
                                 if v is not None:
                                     merged[k] = v
@@ -1204,24 +1450,10 @@ class SignalRClient:
                             {"door_id": did, "status": payload},
                         )
 
-                    if "has been overridden" in msg_l and "current state is" in msg_l:
-                        m = re.search(r"current state is\s+([a-z\s/]+)", msg_l)
-                        mode_txt = (m.group(1).strip() if m else "")
-                        modes_ordered = [
-                            (r"\bcard\s+or\s+pin\b", 3),
-                            (r"\bcard\s+and\s+pin\b", 4),
-                            (r"\bfirst\s+credential\s+in\b", 6),
-                            (r"\bdual\s+credential\b", 7),
-                            (r"\blockdown\b", 0),
-                            (r"\bunlock(?:ed)?\b", 5),
-                            (r"\bpin\b", 2),
-                            (r"\bcard\b", 1),
-                        ]
-                        tz = None
-                        for pat, val in modes_ordered:
-                            if re.search(pat, mode_txt):
-                                tz = val
-                                break
+                    override_m = _OVERRIDE_LINE_RE.match(msg_l)
+                    if override_m:
+                        mode_txt = (override_m.group("mode") or "").strip()
+                        tz = _mode_tz_from_text(mode_txt)
                         payload = {"overridden": True}
                         if tz is not None:
                             payload["timeZone"] = tz
@@ -1230,24 +1462,15 @@ class SignalRClient:
                                 payload["opener"] = True
                         _emit_status(payload)
 
-                    elif ("unlock until resume" in msg_l
-                          or "unlock until next schedule" in msg_l
-                          or "timed override unlock" in msg_l):
-                        _emit_status({"strike": True, "opener": True, "overridden": True, "timeZone": 5})
-
-                    elif ("cardorpin until resume" in msg_l
-                          or "card or pin until resume" in msg_l):
-                        _emit_status({"overridden": True, "timeZone": 3})
-
-                    elif (
-                        "resume schedule" in msg_l
-                        or "schedule resumed" in msg_l
-                        or "returned to schedule" in msg_l
-                        or "override cleared" in msg_l
-                        or "has resumed from an overridden state" in msg_l
-                    ):
-                        restore_tz = self._baseline_reader_tz.get(did, 1)
-                        _emit_status({"overridden": False, "timeZone": restore_tz})
+                    else:
+                        action = _synth_action_from_text(msg_l)
+                        if action == "unlock":
+                            _emit_status({"strike": True, "opener": True, "overridden": True, "timeZone": 5})
+                        elif action == "card_or_pin":
+                            _emit_status({"overridden": True, "timeZone": 3})
+                        elif action == "resume":
+                            restore_tz = self._baseline_reader_tz.get(did, 1)
+                            _emit_status({"overridden": False, "timeZone": restore_tz})
 
                     if ntype == "DOOR_LOCK_STATE":
                         if "unlocked" in msg_l: